@@ -52,8 +52,9 @@ class Reward:
 
     def set_idx(self, obs):
         if self._idx is None:
+            pos = {name: i for i, name in enumerate(obs)}
             self._idx = nested_map(
-                lambda n: obs.index(n),
+                lambda n: pos[n],
                 [[f'lc1.inductor{k}.i' for k in '123'], 'master.phase', [f'master.SPI{k}' for k in 'dq0']])
 
     def rew_fun(self, cols: List[str], data: np.ndarray) -> float:
@@ -81,11 +82,11 @@ class Reward:
         # (due to normalization the control error is often around zero -> compared to MSE metric, the MRE provides
         #  better, i.e. more significant,  gradients)
         # plus barrier penalty for violating the current constraint
-        error = np.sum((np.abs((ISPabc_master - Iabc_master)) / iLimit) ** 0.5, axis=0) \
-                + -np.sum(mu * np.log(1 - np.maximum(np.abs(Iabc_master) - iNominal, 0) / (iLimit - iNominal)), axis=0) \
-                * max_episode_steps
+        error = np.sum(np.sqrt(np.abs(ISPabc_master - Iabc_master) / iLimit)) \
+                - mu * max_episode_steps * np.sum(np.log1p(-np.maximum(np.abs(Iabc_master) - iNominal, 0)
+                                                           / (iLimit - iNominal)))
 
-        return -error.squeeze()
+        return float(-error)
 
 
 if __name__ == '__main__':
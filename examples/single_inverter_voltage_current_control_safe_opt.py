@@ -21,7 +21,7 @@ from openmodelica_microgrid_gym.agents.util import MutableFloat
 from openmodelica_microgrid_gym.aux_ctl import PI_params, DroopParams, MultiPhaseDQCurrentSourcingController, \
     MultiPhaseDQ0PIPIController
 from openmodelica_microgrid_gym.env import PlotTmpl
-from openmodelica_microgrid_gym.util import dq0_to_abc, nested_map, FullHistory
+from openmodelica_microgrid_gym.util import dq0_to_abc_cos_sin, nested_map, FullHistory
 
 
 # Simulation definitions
@@ -48,8 +48,9 @@ class Reward:
 
     def set_idx(self, obs):
         if self._idx is None:
+            pos = {name: i for i, name in enumerate(obs)}
             self._idx = nested_map(
-                lambda n: obs.index(n),
+                lambda n: pos[n],
                 [[f'lc1.inductor{k}.i' for k in '123'], 'master.phase', [f'master.SPI{k}' for k in 'dq0'],
                  [f'lc1.capacitor{k}.v' for k in '123'], [f'master.SPV{k}' for k in 'dq0']])
 
@@ -74,19 +75,21 @@ class Reward:
 
         # set points (sp)
         isp_dq0_master = data[idx[2]]  # setting dq current reference
-        isp_abc_master = dq0_to_abc(isp_dq0_master, phase)  # convert dq set-points into three-phase abc coordinates
         vsp_dq0_master = data[idx[4]]  # setting dq voltage reference
-        vsp_abc_master = dq0_to_abc(vsp_dq0_master, phase)  # convert dq set-points into three-phase abc coordinates
+        # both set points are transformed with the same angle, hence cos and sin are only calculated once
+        cos, sin = np.cos(phase), np.sin(phase)
+        isp_abc_master = dq0_to_abc_cos_sin(isp_dq0_master, cos, sin)  # convert dq set-points into three-phase abc
+        vsp_abc_master = dq0_to_abc_cos_sin(vsp_dq0_master, cos, sin)  # convert dq set-points into three-phase abc
 
         # control error = mean-root-error (MRE) of reference minus measurement
         # (due to normalization the control error is often around zero -> compared to MSE metric, the MRE provides
         #  better, i.e. more significant,  gradients)
         # plus barrier penalty for violating the current constraint
-        error = np.sum((np.abs((isp_abc_master - iabc_master)) / iLimit) ** 0.5, axis=0) \
-                + -np.sum(mu * np.log(1 - np.maximum(np.abs(iabc_master) - iNominal, 0) / (iLimit - iNominal)), axis=0)\
-                + np.sum((np.abs((vsp_abc_master - vabc_master)) / nomVoltPeak) ** 0.5, axis=0)
+        error = (np.sum(np.sqrt(np.abs(isp_abc_master - iabc_master) / iLimit))
+                 - mu * np.sum(np.log1p(-np.maximum(np.abs(iabc_master) - iNominal, 0) / (iLimit - iNominal)))
+                 + np.sum(np.sqrt(np.abs(vsp_abc_master - vabc_master) / nomVoltPeak)))
 
-        return -error.squeeze()
+        return float(-error)
 
 
 if __name__ == '__main__':
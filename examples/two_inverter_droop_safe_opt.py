@@ -6,7 +6,6 @@
 
 import logging
 import os
-from functools import partial
 from time import strftime, gmtime
 from typing import List
 
@@ -31,6 +30,7 @@ num_episodes = 10  # number of simulation episodes (i.e. SafeOpt iterations)
 v_DC = 1000  # DC-link voltage / V; will be set as model parameter in the FMU
 nomFreq = 50  # nominal grid frequency / Hz
 nomVoltPeak = 230 * 1.414  # nominal grid voltage / V
+nomVdq0 = np.array([nomVoltPeak, 0, 0])  # nominal voltage set-point in the dq0 frame / V
 iLimit = 30  # inverter current limit / A
 iNominal = 20  # nominal inverter current / A
 mu = 2  # factor for barrier function (see below)
@@ -60,8 +60,9 @@ class Reward:
 
     def set_idx(self, obs):
         if self._idx is None:
+            pos = {name: i for i, name in enumerate(obs)}
             self._idx = nested_map(
-                lambda n: obs.index(n),
+                lambda n: pos[n],
                 [[f'slave.freq'],
                  [f'master.CVV{s}' for s in 'dq0']])
 
@@ -84,10 +85,10 @@ class Reward:
         # control error = mean-root-error (MRE) of reference minus measurement
         # (due to normalization the control error is often around zero -> compared to MSE metric, the MRE provides
         #  better, i.e. more significant,  gradients)
-        error = np.sum((np.abs((nomFreq - freq)) / nomFreq) ** 0.5, axis=0) + \
-                np.sum((np.abs(([nomVoltPeak, 0, 0] - vdq0_master)) / nomVoltPeak) ** 0.5, axis=0)
+        error = np.sum(np.sqrt(np.abs(nomFreq - freq) / nomFreq), axis=0) + \
+                np.sum(np.sqrt(np.abs(nomVdq0 - vdq0_master) / nomVoltPeak), axis=0)
 
-        return -error.squeeze()
+        return float(-error)
 
 
 if __name__ == '__main__':
@@ -249,6 +250,12 @@ if __name__ == '__main__':
         fig.savefig(save_folder + '/f_slave' + time + '.pdf')
 
 
+    def r_load(t):
+        return load_step(t, 20)
+
+    def l_load(t):
+        return load_step(t, 0.001)
+
     env = gym.make('openmodelica_microgrid_gym:ModelicaEnv_test-v1',
                    reward_fun=Reward().rew_fun,
                    time_step=delta_t,
@@ -275,12 +282,12 @@ if __name__ == '__main__':
                    log_level=logging.INFO,
                    viz_mode='episode',
                    max_episode_steps=max_episode_steps,
-                   model_params={'rl1.resistor1.R': partial(load_step, gain=20),
-                                 'rl1.resistor2.R': partial(load_step, gain=20),
-                                 'rl1.resistor3.R': partial(load_step, gain=20),
-                                 'rl1.inductor1.L': partial(load_step, gain=0.001),  # 0.001,
-                                 'rl1.inductor2.L': partial(load_step, gain=0.001),  # 0.001,
-                                 'rl1.inductor3.L': partial(load_step, gain=0.001)  # 0.001
+                   model_params={'rl1.resistor1.R': r_load,
+                                 'rl1.resistor2.R': r_load,
+                                 'rl1.resistor3.R': r_load,
+                                 'rl1.inductor1.L': l_load,  # 0.001,
+                                 'rl1.inductor2.L': l_load,  # 0.001,
+                                 'rl1.inductor3.L': l_load  # 0.001
                                  },
                    model_path='../OpenModelica_Microgrids/OpenModelica_Microgrids.Grids.Network.fmu',
                    model_input=['i1p1', 'i1p2', 'i1p3', 'i2p1', 'i2p2', 'i2p3'],
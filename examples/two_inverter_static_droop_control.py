@@ -7,7 +7,6 @@
 # frequency and voltage change due to its droop control parameters by a power/reactive power change.
 
 import logging
-from functools import partial
 
 import gym
 import numpy as np
@@ -82,6 +81,10 @@ if __name__ == '__main__':
                                                 [f'lcl1.capacitor{k}.v' for k in '123'],
                                                 np.zeros(3)]})
 
+    # the load of all three phases is changed equally, so the phases share one load function
+    def r_load(t):
+        return load_step(t, 20)
+
     # Define the environment
     env = gym.make('openmodelica_microgrid_gym:ModelicaEnv_test-v1',
                    viz_mode='episode',
@@ -90,9 +93,9 @@ if __name__ == '__main__':
                    log_level=logging.INFO,
                    time_step=delta_t,
                    max_episode_steps=max_episode_steps,
-                   model_params={'rl1.resistor1.R': partial(load_step,gain=20),
-                                 'rl1.resistor2.R': partial(load_step,gain=20),
-                                 'rl1.resistor3.R': partial(load_step,gain=20),
+                   model_params={'rl1.resistor1.R': r_load,
+                                 'rl1.resistor2.R': r_load,
+                                 'rl1.resistor3.R': r_load,
                                  'rl1.inductor1.L': 0.001,
                                  'rl1.inductor2.L': 0.001,
                                  'rl1.inductor3.L': 0.001
@@ -1,4 +1,3 @@
-import importlib
 import logging
 from typing import Dict, Union, Any, List, Mapping
 
@@ -73,13 +72,8 @@ class SafeOptAgent(StaticControlAgent):
         Resets the kernel, episodic reward and the optimizer
         """
         # reinstantiate kernel
-
-        kernel_params = self.kernel.to_dict()
-        cls_name = kernel_params['class']
-        mod = importlib.import_module('.'.join(cls_name.split('.')[:-1]))
-        cls = getattr(mod, cls_name.split('.')[-1])
-        remaining_params = {k: v for k, v in kernel_params.items() if k not in {'class', 'useGPU'}}
-        self.kernel = cls(**remaining_params)
+        # copying is cheaper than rebuilding it from its dict representation and cuts the link to the previous GP
+        self.kernel = self.kernel.copy()
 
         self.params.reset()
         self.optimizer = None
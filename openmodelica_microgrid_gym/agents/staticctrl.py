@@ -33,7 +33,11 @@ class ObsTempl:
                 self._data.append(tmpl)
             else:
                 # else we save the indices of the variables into an indexarray
-                self._data.append(np.array([idx[varname] for varname in tmpl]))
+                indices = np.array([idx[varname] for varname in tmpl])
+                if len(indices) and np.all(np.diff(indices) == 1):
+                    # consecutive variables can be selected by a slice, which yields a view instead of a copy
+                    indices = slice(int(indices[0]), int(indices[-1]) + 1)
+                self._data.append(indices)
 
     def fill(self, obs: np.ndarray) -> List[np.ndarray]:
         """
@@ -41,9 +41,11 @@ class PIController:
 
         self.integralSum = self.integralSum + (self._params.kI * error + self.windup_compensation) * self._ts
         output = self._params.kP * error + self.integralSum
-        clipped = np.clip(output, *self._params.limits)
+        # builtin min/max are much faster than np.clip for a single value
+        lower, upper = self._params.limits
+        clipped = min(max(output, lower), upper)
         self.windup_compensation = (output - clipped) * self._params.kB
-        return clipped.squeeze()
+        return clipped
 
 
 class MultiPhasePIController:
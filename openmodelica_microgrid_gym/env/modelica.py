@@ -2,7 +2,6 @@ import logging
 import re
 from datetime import datetime
 from fnmatch import translate
-from functools import partial
 from os.path import basename
 from typing import Sequence, Callable, List, Union, Tuple, Optional, Mapping, Dict, Any
 
@@ -63,7 +62,7 @@ class ModelicaEnv(gym.Env):
             dictionary of variable names and scalars or callables.
             If a callable is provided it is called every time step with the current time.
             This callable must return a float that is passed to the fmu.
-        :param model_input: list of strings. Each string representing a FMU input variable.
+        :param model_input: list of strings. Each string representing a FMU input variable of type Real.
         :param model_output: nested dictionaries containing nested lists of strings.
          The keys of the nested dictionaries will be flattened down and appended to their children and finally prepended
          to the strings in the nested lists. The strings final strings represent variables from the FMU and the nesting
@@ -113,12 +112,11 @@ class ModelicaEnv(gym.Env):
         self.time_end = np.inf if max_episode_steps is None \
             else self.time_start + max_episode_steps * self.time_step_size
 
-        # if there are parameters, we will convert all scalars to constant functions.
+        # if there are parameters, we separate the scalars from the callables,
+        # such that only the callables have to be evaluated in every time step.
         model_params = model_params or dict()
-        # the "partial" is needed because of some absurd python behaviour https://stackoverflow.com/a/34021333/13310191
-        self.model_parameters = {var: (val if callable(val) else partial(lambda t, val_: val_, val_=val)) for var, val
-                                 in
-                                 model_params.items()}
+        self.model_parameters = {var: val for var, val in model_params.items() if callable(val)}
+        self.model_constants = {var: val for var, val in model_params.items() if not callable(val)}
 
         self.sim_time_interval = None
         self._state = []
@@ -195,7 +193,7 @@ class ModelicaEnv(gym.Env):
 
         :return: resulting state of the environment
         """
-        logger.debug(f'Simulation started for time interval {self.sim_time_interval[0]}-{self.sim_time_interval[1]}')
+        logger.debug('Simulation started for time interval %s-%s', *self.sim_time_interval)
 
         # Advance
         x_0 = self.model.states
@@ -220,7 +218,7 @@ class ModelicaEnv(gym.Env):
             logger.info(f'reward was extreme, episode terminated')
             return True
         # TODO allow for other stopping criteria
-        logger.debug(f't: {self.sim_time_interval[1]}, ')
+        logger.debug('t: %s, ', self.sim_time_interval[1])
         return abs(self.sim_time_interval[1]) > self.time_end
 
     def reset(self) -> np.ndarray:
@@ -235,7 +233,7 @@ class ModelicaEnv(gym.Env):
         """
         logger.debug("Experiment reset was called. Resetting the model.")
         self.sim_time_interval = np.array([self.time_start, self.time_start + self.time_step_size])
-        self.model.setup(self.time_start, self.model_output_names)
+        self.model.setup(self.time_start, self.model_output_names, self.model_input_names)
 
         self.history.reset()
         self._state = self._simulate()
@@ -271,17 +269,18 @@ class ModelicaEnv(gym.Env):
             logger.warning("Model input values (action) should be passed as a list")
 
         # Check if number of model inputs equals number of values passed
-        if len(action) != len(list(self.model_input_names)):
-            message = f'List of values for model inputs should be of the length {len(list(self.model_input_names))},'
+        if len(action) != len(self.model_input_names):
+            message = f'List of values for model inputs should be of the length {len(self.model_input_names)},'
             f'equal to the number of model inputs. Actual length {len(action)}'
             logger.error(message)
             raise ValueError(message)
 
         # Set input values of the model
         logger.debug('model input: %s, values: %s', self.model_input_names, action)
-        self.model.set(**dict(zip(self.model_input_names, action)))
-        if self.model_parameters:
-            values = {var: f(self.sim_time_interval[0]) for var, f in self.model_parameters.items()}
+        self.model.set_inputs(np.asarray(action, dtype=float))
+        if self.model_parameters or self.model_constants:
+            t = self.sim_time_interval[0]
+            values = {**self.model_constants, **{var: f(t) for var, f in self.model_parameters.items()}}
             # list of keys and list of values
             self.model.set_params(**values)
 
@@ -323,6 +322,8 @@ class ModelicaEnv(gym.Env):
                 pass
             else:
                 figs = []
+                history = self.history.df
+                time = history.index * self.time_step_size + self.time_start
 
                 # plot cols by theirs structure filtered by the vis_cols param
                 for cols in self.history.structured_cols():
@@ -331,8 +332,7 @@ class ModelicaEnv(gym.Env):
                     cols = [col for col in cols if re.fullmatch(self.viz_col_regex, col)]
                     if not cols:
                         continue
-                    df = self.history.df[cols].copy()
-                    df.index = self.history.df.index * self.time_step_size + self.time_start
+                    df = history[cols].set_index(time)
 
                     fig, ax = plt.subplots()
                     df.plot(legend=True, figure=fig, ax=ax)
@@ -344,8 +344,7 @@ class ModelicaEnv(gym.Env):
                     fig, ax = plt.subplots()
 
                     for series, kwargs in tmpl:
-                        ser = self.history.df[series].copy()
-                        ser.index = self.history.df.index * self.time_step_size + self.time_start
+                        ser = history[series].set_axis(time)
                         ser.plot(figure=fig, ax=ax, **kwargs)
                     tmpl.callback(fig)
                     figs.append(fig)
@@ -391,7 +390,7 @@ class NormalizedEnv(ModelicaEnv):
         obs, rew, done, info = super().step(action)
         outputs = self.net.augment(obs, self.is_normalized)
         outputs = np.hstack((outputs, obs[len(self.net.out_vars(False)):]))
-        self.history._data.pop()
+        self.history.pop()
         self.history.append(outputs)
 
         return outputs, rew, done, info
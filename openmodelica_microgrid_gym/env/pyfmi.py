@@ -4,7 +4,7 @@ from os.path import basename
 import numpy as np
 
 from pyfmi import load_fmu
-from pyfmi.fmi import FMUModelME2
+from pyfmi.fmi import FMUModelME2, FMI2_REAL
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +14,11 @@ class PyFMI_Wrapper:
 
     def __init__(self, model):
         self.model = model
+        self.model_output_idx = None
+        self.model_input_idx = None
+        self._output_names = None
+        self._input_names = None
+        self._jacc_refs = None
 
     @classmethod
     def load(cls, path):
@@ -23,7 +28,7 @@ class PyFMI_Wrapper:
         logger.debug('Successfully loaded model "%s"', model_name)
         return model
 
-    def setup(self, time_start, output_names):
+    def setup(self, time_start, output_names, input_names):
         self.model.reset()
         self.model.setup_experiment(start_time=time_start)
 
@@ -39,7 +44,17 @@ class PyFMI_Wrapper:
         self.model.enter_continuous_time_mode()
 
         # precalculating indices for more efficient lookup
-        self.model_output_idx = np.array([self.model.get_variable_valueref(k) for k in output_names])
+        # the value references are fixed for the loaded model, so they are only resolved again if the outputs change
+        if self._output_names != list(output_names):
+            self.model_output_idx = np.array([self.model.get_variable_valueref(k) for k in output_names])
+            self._output_names = list(output_names)
+        if self._input_names != list(input_names):
+            # the inputs are written with set_real() in every step, so other data types are not supported
+            non_real = [k for k in input_names if self.model.get_variable_data_type(k) != FMI2_REAL]
+            if non_real:
+                raise ValueError(f'Model inputs must be of type Real, but {non_real} are not.')
+            self.model_input_idx = np.array([self.model.get_variable_valueref(k) for k in input_names])
+            self._input_names = list(input_names)
 
     @property
     def obs(self):
@@ -67,15 +82,28 @@ class PyFMI_Wrapper:
 
     def jacc(self):
         # get state and derivative value reference lists
-        refs = [[s.value_reference for s in getattr(self.model, attr)().values()]
-                for attr in
-                ['get_states_list', 'get_derivatives_list']]
+        # they do not change for the loaded model, so they are only collected on the first call
+        if self._jacc_refs is None:
+            self._jacc_refs = [[s.value_reference for s in getattr(self.model, attr)().values()]
+                               for attr in
+                               ['get_states_list', 'get_derivatives_list']]
+        refs = self._jacc_refs
         jacobian = np.identity(len(refs[1]))
         np.apply_along_axis(lambda col: self.model.get_directional_derivative(*refs, col), 0, jacobian)
         return jacobian
 
-    def set(self, **kwargs):
-        self.model.set(*zip(*kwargs.items()))
+    def set_inputs(self, values):
+        """
+        Sets the model inputs by the value references resolved in setup().
+        All inputs must be FMU variables of type Real.
+
+        :param values: values of the inputs in the order of the input names passed to setup()
+        """
+        if self.model_input_idx is None:
+            raise RuntimeError('The model inputs are not resolved, call setup() with the input names first.')
+        if len(values) != len(self.model_input_idx):
+            raise ValueError(f'Expected {len(self.model_input_idx)} input values, got {len(values)}.')
+        self.model.set_real(self.model_input_idx, values)
 
     def set_params(self, **kwargs):
         self.model.initialize()
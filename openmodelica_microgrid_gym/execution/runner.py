@@ -30,12 +30,14 @@ class Runner:
         - "agent_plt": last agent plot
         """
 
-    def run(self, n_episodes: int = 10, visualise: bool = False):
+    def run(self, n_episodes: int = 10, visualise: bool = False, visualise_best_only: bool = False):
         """
         Trains/executes the agent on the environment for a number of epochs
 
         :param n_episodes: number of epochs to play
         :param visualise: turns on visualization of the environment
+        :param visualise_best_only: if visualisation is turned on, the environment is only plotted for the first episode
+            and the episodes in which the agent has improved, i.e. the candidates for "best_env_plt"
         """
         self.agent.reset()
         self.env.history.cols = self.env.history.structured_cols(None) + self.agent.measurement_cols
@@ -43,6 +45,8 @@ class Runner:
 
         if not visualise:
             self.env.viz_mode = None
+        # figures are only updated during the episode in the 'step' mode, otherwise they are created on closing
+        render_steps = self.env.viz_mode == 'step'
         agent_fig = None
 
         for i in tqdm(range(n_episodes), desc='episodes', unit='epoch'):
@@ -53,17 +57,22 @@ class Runner:
                 act = self.agent.act(obs)
                 self.env.measurement = self.agent.measurement
                 obs, r, done, info = self.env.step(act)
-                self.env.render()
+                if render_steps:
+                    self.env.render()
                 if done:
                     break
             self.agent.observe(r, done)
-            _, env_fig = self.env.close()
+            is_best = i == 0 or self.agent.has_improved
+            if visualise_best_only and not is_best:
+                env_fig = []
+            else:
+                _, env_fig = self.env.close()
 
             if visualise:
                 agent_fig = self.agent.render()
 
             self.run_data['last_agent_plt'] = agent_fig
 
-            if i == 0 or self.agent.has_improved:
+            if is_best:
                 self.run_data['best_env_plt'] = env_fig
                 self.run_data['best_episode_idx'] = i
@@ -75,6 +75,14 @@ class EmptyHistory(StructuredMapping):
         """
         pass
 
+    def pop(self):
+        """
+        Removes the last data sample from the history. The History class will determine what is removed
+
+        :return: the removed sample
+        """
+        pass
+
     def last(self):
         return self.df.tail(1).squeeze()
 
@@ -93,6 +101,10 @@ class SingleHistory(EmptyHistory):
     def append(self, values: Sequence):
         self._data = values
 
+    def pop(self):
+        values, self._data = self._data, None
+        return values
+
     def last(self):
         return self._data
 
@@ -102,16 +114,38 @@ class FullHistory(EmptyHistory):
     Full history that stores all data
     """
 
+    @EmptyHistory.cols.setter
+    def cols(self, val: List[Union[List, str]]):
+        EmptyHistory.cols.fset(self, val)
+        self._df = None
+
     def reset(self):
         self._data = []
+        self._df = None
 
     def append(self, values: Sequence):
         self._data.append(list(values))
+        self._df = None
+
+    def pop(self):
+        """
+        Removes the last data sample from the history
+
+        :return: the removed sample
+        """
+        self._df = None
+        return self._data.pop()
 
     def last(self):
         return self._data[-1]
 
     @property
     def df(self):
-        # executing this conditionally only if _data is not a df is actually slower!!!
-        return pd.DataFrame(self._data, columns=self.cols)
+        """
+        DataFrame of all recorded data.
+        It is only built on demand and reused until the data or the columns change.
+        The returned frame is shared between callers and must not be modified in place, use a copy instead.
+        """
+        if self._df is None:
+            self._df = pd.DataFrame(self._data, columns=self.cols)
+        return self._df
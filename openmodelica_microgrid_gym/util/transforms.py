@@ -19,7 +19,8 @@ def dq0_to_abc(dq0: np.ndarray, theta: float) -> np.ndarray:
 
     :return abc: The transformed space in the abc frame
     """
-    return dq0_to_abc_cos_sin(dq0, *cos_sin(theta))
+    # calling cos and sin directly avoids packing them into a temporary array like cos_sin() does
+    return dq0_to_abc_cos_sin(dq0, np.cos(theta), np.sin(theta))
 
 
 def dq0_to_abc_cos_sin(dq0: np.ndarray, cos: float, sin: float) -> np.ndarray:
@@ -82,7 +83,7 @@ def abc_to_dq0(abc: np.ndarray, theta: float) -> np.ndarray:
 
     :return dq0: The transformed space in the abc frame
     """
-    return abc_to_dq0_cos_sin(abc, *cos_sin(theta))
+    return abc_to_dq0_cos_sin(abc, np.cos(theta), np.sin(theta))
 
 
 def abc_to_dq0_cos_sin(abc: np.ndarray, cos: float, sin: float) -> np.ndarray:
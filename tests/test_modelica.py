@@ -72,3 +72,24 @@ def test_params_simple():
                           -7.29991175e-01, 1.76505718e+02, 4.10540511e+02, 3.52688013e+01])
     assert r == 1
     assert not done
+
+
+def test_params_shared_callable():
+    calls = []
+
+    def fun(t):
+        calls.append(t)
+        return len(calls)
+
+    env = gym.make('openmodelica_microgrid_gym:ModelicaEnv_test-v1',
+                   viz_mode=None,
+                   max_episode_steps=100,
+                   model_path='OpenModelica_Microgrids/test.fmu',
+                   model_params=dict(i1p1=fun, i1p2=fun, i1p3=fun),
+                   model_input=['i2p1', 'i2p2', 'i2p3'],
+                   model_output={'lc1': [['inductor1.i', 'inductor2.i', 'inductor3.i'],
+                                         ['capacitor1.v', 'capacitor2.v', 'capacitor3.v']]})
+    env.reset()
+    env.step(np.zeros(3))
+    # every parameter is evaluated on its own, so stateful callables yield independent values
+    assert len(calls) == 3
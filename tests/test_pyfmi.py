@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+from pyfmi.fmi import FMI2_REAL, FMI2_INTEGER
+
+from openmodelica_microgrid_gym.env.pyfmi import PyFMI_Wrapper
+
+
+class FakeEventInfo:
+    newDiscreteStatesNeeded = False
+
+
+class FakeModel:
+    """Minimal stand-in for a pyfmi model exchange FMU"""
+
+    def __init__(self, types):
+        self.types = types
+        self.refs = {name: i for i, name in enumerate(types)}
+        self.values = {}
+
+    def __getattr__(self, item):
+        # lifecycle calls made by PyFMI_Wrapper.setup() are irrelevant here
+        return lambda *args, **kwargs: None
+
+    def get_event_info(self):
+        return FakeEventInfo()
+
+    def get_variable_valueref(self, name):
+        return self.refs[name]
+
+    def get_variable_data_type(self, name):
+        return self.types[name]
+
+    def set_real(self, refs, values):
+        self.values.update(zip(refs, values))
+
+
+def test_set_inputs():
+    model = FakeModel(dict(a=FMI2_REAL, b=FMI2_REAL))
+    wrapper = PyFMI_Wrapper(model)
+    with pytest.raises(RuntimeError):
+        wrapper.set_inputs(np.ones(2))
+
+    wrapper.setup(0, [], ['b', 'a'])
+    wrapper.set_inputs(np.array([1., 2.]))
+    assert model.values == {1: 1., 0: 2.}
+
+    with pytest.raises(ValueError):
+        wrapper.set_inputs(np.ones(3))
+
+
+def test_setup_non_real_input():
+    with pytest.raises(ValueError):
+        PyFMI_Wrapper(FakeModel(dict(a=FMI2_REAL, b=FMI2_INTEGER))).setup(0, [], ['a', 'b'])
@@ -1,7 +1,7 @@
 import numpy as np
 import pandas as pd
 
-from openmodelica_microgrid_gym.util import FullHistory
+from openmodelica_microgrid_gym.util import EmptyHistory, SingleHistory, FullHistory
 
 
 def test__append():
@@ -11,3 +11,32 @@ def test__append():
     rec.append([3, 3, 3])
 
     assert rec.df.equals(pd.DataFrame([dict(a=1, b=2, c=3), dict(a=3, b=3, c=3)]))
+
+
+def test__df_cache():
+    rec = FullHistory(['a b c'.split()])
+    rec.reset()
+    rec.append([1, 2, 3])
+    assert rec.df is rec.df
+
+    rec.append([3, 3, 3])
+    assert rec.df.equals(pd.DataFrame([dict(a=1, b=2, c=3), dict(a=3, b=3, c=3)]))
+
+    rec.cols = ['x', 'y', 'z']
+    assert list(rec.df.columns) == ['x', 'y', 'z']
+
+    assert rec.pop() == [3, 3, 3]
+    assert rec.df.equals(pd.DataFrame([dict(x=1, y=2, z=3)]))
+
+
+def test__pop():
+    rec = SingleHistory(['a b c'.split()])
+    rec.reset()
+    rec.append([1, 2, 3])
+    assert rec.pop() == [1, 2, 3]
+    assert rec.last() is None
+
+    rec = EmptyHistory(['a b c'.split()])
+    rec.reset()
+    rec.append([1, 2, 3])
+    assert rec.pop() is None
@@ -126,3 +126,55 @@ def test_simpleagent(env):
     df2 = pd.read_hdf('tests/test_main3.hd5', 'hist').head(50)  # noqa
     df2 = df2.reindex(sorted(df2.columns), axis=1)
     assert df[out_params].to_numpy() == approx(df2[out_params].to_numpy(), 5e-3)
+
+
+def test_visualise_best_only(agent, env):
+    env, _, _ = env
+    closed = []
+
+    def close():
+        closed.append(len(closed))
+        return True, [f'fig{len(closed)}']
+
+    env.close = close
+    runner = Runner(agent[1], env)
+    # the static agent never improves, so only the first episode is plotted
+    runner.run(3, visualise=True, visualise_best_only=True)
+    assert closed == [0]
+    assert runner.run_data['best_env_plt'] == ['fig1']
+    assert runner.run_data['best_episode_idx'] == 0
+
+
+def test_visualise_best_only_improved(env):
+    env, inputs, _ = env
+
+    class ImprovingAgent(Agent):
+        def __init__(self):
+            super().__init__()
+            self.episode = -1
+
+        def act(self, obs: np.ndarray) -> np.ndarray:
+            return np.zeros(len(inputs))
+
+        def observe(self, reward: float, terminated: bool):
+            # the runner passes no reward before the first step of an episode
+            if reward is None:
+                self.episode += 1
+
+        @property
+        def has_improved(self) -> bool:
+            return self.episode == 2
+
+    agent = ImprovingAgent()
+    closed = []
+
+    def close():
+        closed.append(agent.episode)
+        return True, [f'fig{agent.episode}']
+
+    env.close = close
+    runner = Runner(agent, env)
+    runner.run(4, visualise=True, visualise_best_only=True)
+    assert closed == [0, 2]
+    assert runner.run_data['best_env_plt'] == ['fig2']
+    assert runner.run_data['best_episode_idx'] == 2
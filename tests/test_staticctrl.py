@@ -0,0 +1,14 @@
+import numpy as np
+
+from openmodelica_microgrid_gym.agents.staticctrl import ObsTempl
+
+
+def test_obs_templ_fill():
+    tmpl = ObsTempl(list('abcde'), [['b', 'c', 'd'], ['d', 'a'], np.zeros(2)])
+    obs = np.arange(5.)
+    consecutive, scattered, static = tmpl.fill(obs)
+
+    assert consecutive.tolist() == [1, 2, 3]
+    assert np.shares_memory(consecutive, obs)
+    assert scattered.tolist() == [3, 0]
+    assert static.tolist() == [0, 0]